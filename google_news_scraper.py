@@ -1,88 +1,232 @@
-import requests
-from bs4 import BeautifulSoup
-import urllib.parse
+import asyncio
+import httpx
+from cachetools import TTLCache
+import lxml.html
+from lxml.etree import XPath, HTMLPullParser
 from datetime import datetime, timedelta
 import time
-import json
+import orjson
 from typing import List, Dict, Optional
 import re
+from itertools import islice
+
+
+def _css_class(name: str) -> str:
+    """Predicado XPath equivalente ao seletor CSS '.name'"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def _has_classes(*names: str) -> str:
+    """Predicado XPath equivalente ao seletor CSS '.a, .b, ...'"""
+    return ' or '.join(_css_class(name) for name in names)
+
+
+def _first_of(tags=(), classes=()) -> XPath:
+    """
+    Compila a união 'tag, ..., .classe, ...' como um único XPath que devolve
+    o primeiro descendente encontrado, em ordem de documento
+    """
+    alternatives = [f'.//{tag}' for tag in tags]
+    if classes:
+        alternatives.append(f'.//*[{_has_classes(*classes)}]')
+    return XPath(f'({" | ".join(alternatives)})[1]')
+
+
+# Seletores do Google News compilados uma única vez; cada lista de seletores
+# CSS vira uma única união, avaliada em uma só passada pela árvore
+# Caminho principal: os contêineres de notícia, sem [data-n-au] aninhado em <article>
+_XP_ARTICLES = XPath('//article | //*[@data-n-au][not(ancestor::article)]')
+# Layouts antigos/alternativos, só consultados se não houver contêineres
+_XP_ARTICLES_FALLBACK = XPath(f'//*[{_has_classes("JtKRv", "xrnccd", "WwrzSb", "DY5T1d")}]')
+_XP_TITLE = _first_of(tags=('h3', 'h4'), classes=('DY5T1d', 'JtKRv', 'ipQwMb', 'mCBkyc'))
+_XP_SOURCE = _first_of(classes=('wEwyrc', 'vr1PYe', 'CEMjEf'))
+_XP_TIME = _first_of(tags=('time',), classes=('r0bn4c', 'WW6dff'))
+_XP_DESC = _first_of(classes=('st', 'Y3v8qd'))
+_XP_LINK = XPath('(.//a)[1]/@href', smart_strings=False)
+
+# Origem usada para completar os links relativos das notícias
+_BASE = 'https://news.google.com'
+
+
+def _outermost(elements: List) -> List:
+    """
+    Remove candidatos aninhados dentro de outro candidato (a união de
+    seletores pega tanto o contêiner .xrnccd quanto o link de título dentro dele)
+    """
+    found = set(elements)
+    return [el for el in elements if not any(p in found for p in el.iterancestors())]
+
+
+def _is_article(el) -> bool:
+    """Mesmo critério de _XP_ARTICLES, para um elemento já completo no parse incremental"""
+    if el.tag == 'article':
+        return True
+    return el.get('data-n-au') is not None and next(el.iterancestors('article'), None) is None
+
+
+# Formatos de tempo relativo ("18 horas atrás", "2 meses atrás", ...) em um
+# único padrão; a unidade capturada indexa o timedelta correspondente
+_TIME_RE = re.compile(r'(\d+)\s*(minuto|hora|dia|semana|meses|mês|mes|ano)s?\s*atrás')
+_UNIT_TO_DELTA = {
+    'minuto': lambda v: timedelta(minutes=v),
+    'hora': lambda v: timedelta(hours=v),
+    'dia': lambda v: timedelta(days=v),
+    'semana': lambda v: timedelta(weeks=v),
+    'mes': lambda v: timedelta(days=30 * v),  # Aproximação
+    'mês': lambda v: timedelta(days=30 * v),
+    'meses': lambda v: timedelta(days=30 * v),
+    'ano': lambda v: timedelta(days=365 * v),  # Aproximação
+}
+
+
+def parse_time_ago(time_text: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Converte texto de tempo relativo para datetime
+    
+    O formato usual ("18 horas atrás") é resolvido com split + dicionário;
+    a regex só é usada para formatos inesperados.
+    
+    Args:
+        time_text: Texto como "18 horas atrás", "2 dias atrás", etc.
+        now: Instante de referência (padrão: datetime.now())
+        
+    Returns:
+        datetime object ou None se não conseguir parsear
+    """
+    time_text = (time_text or '').lower().strip()
+    if now is None:
+        now = datetime.now()
+    
+    parts = time_text.split()
+    if len(parts) == 3 and parts[0].isdecimal() and parts[2] == 'atrás':
+        unit = parts[1]
+        to_delta = _UNIT_TO_DELTA.get(unit)
+        if to_delta is None and unit.endswith('s'):
+            to_delta = _UNIT_TO_DELTA.get(unit[:-1])
+        if to_delta is not None:
+            try:
+                return now - to_delta(int(parts[0]))
+            except (OverflowError, ValueError):
+                # Valores absurdos ("3000 anos atrás") saem do intervalo de datetime
+                return None
+    
+    match = _TIME_RE.search(time_text)
+    if not match:
+        return None
+    
+    try:
+        return now - _UNIT_TO_DELTA[match.group(2)](int(match.group(1)))
+    except (OverflowError, ValueError):
+        return None
+
 
 class GoogleNewsScraper:
-    def __init__(self, user_agent: str = None):
+    def __init__(
+        self,
+        user_agent: str = None,
+        cache_ttl: int = 600,
+        cache_size: int = 1024,
+        require_name_in_title: bool = True,
+        min_title_len: int = 10,
+        candidate_factor: Optional[int] = 2,
+    ):
         """
         Inicializa o scraper do Google News
         
         Args:
             user_agent: User agent personalizado para as requisições
+            cache_ttl: Tempo (segundos) que o resultado de uma busca fica em cache
+            cache_size: Número máximo de buscas mantidas em cache
+            require_name_in_title: Só aceita artigos cujo título contém o nome buscado
+            min_title_len: Tamanho mínimo do título para o artigo ser aceito
+            candidate_factor: Quantos candidatos examinar por resultado pedido
+                (None = examina todos os candidatos da página)
         """
+        self.require_name_in_title = require_name_in_title
+        self.min_title_len = min_title_len
+        self.candidate_factor = candidate_factor
         self.base_url = "https://news.google.com/search"
+        # Parâmetros fixos da busca (região/idioma); só 'q' muda por chamada
+        self._static_params = {'hl': 'pt-BR', 'gl': 'BR', 'ceid': 'BR:pt-419'}
         self.headers = {
-            'User-Agent': user_agent or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'User-Agent': user_agent or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
             'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
+            'Referer': 'https://news.google.com/',
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        
+        # Cliente assíncrono único: keep-alive + multiplexação HTTP/2 com o
+        # news.google.com, permitindo várias buscas simultâneas no mesmo event loop.
+        # (sem 'Connection: keep-alive' nos headers: o HTTP/2 proíbe esse header)
+        # HTTP/2, limites e retries ficam no transporte: com `transport=` o
+        # httpx ignora essas opções no cliente
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            retries=2,
+        )
+        self._client = httpx.AsyncClient(headers=self.headers, timeout=30, transport=transport)
+        
+        # Cache das buscas por (nome normalizado, dias, máx. resultados) e um lock
+        # por chave para que buscas idênticas simultâneas façam uma só requisição
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+        # Quantas coroutines usam (ou esperam) cada lock: ele só sai do dicionário
+        # quando a última termina, para que quem chega depois entre na mesma fila
+        self._lock_users: Dict[tuple, int] = {}
+    
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP e suas conexões keep-alive"""
+        await self._client.aclose()
     
-    def _parse_time_ago(self, time_text: str) -> Optional[datetime]:
+    async def __aenter__(self) -> 'GoogleNewsScraper':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    def cache_info(self) -> Dict:
+        """Estatísticas do cache de buscas"""
+        return {'size': len(self._cache), 'maxsize': self._cache.maxsize, 'ttl': self._cache.ttl}
+    
+    @staticmethod
+    def _normalize_gnews_href(href: str) -> str:
         """
-        Converte texto de tempo relativo para datetime
-        
-        Args:
-            time_text: Texto como "18 horas atrás", "2 dias atrás", etc.
-            
-        Returns:
-            datetime object ou None se não conseguir parsear
+        Converte links relativos do Google News ("./read/...", "/read/...") em absolutos
         """
-        try:
-            time_text = time_text.lower().strip()
-            now = datetime.now()
-            
-            # Padrões para diferentes formatos de tempo
-            patterns = {
-                r'(\d+)\s*hora[s]?\s*atrás': 'hours',
-                r'(\d+)\s*dia[s]?\s*atrás': 'days',
-                r'(\d+)\s*semana[s]?\s*atrás': 'weeks',
-                r'(\d+)\s*mês\s*atrás': 'months',
-                r'(\d+)\s*meses\s*atrás': 'months',
-                r'(\d+)\s*ano[s]?\s*atrás': 'years',
-                r'(\d+)\s*minuto[s]?\s*atrás': 'minutes',
-            }
-            
-            for pattern, unit in patterns.items():
-                match = re.search(pattern, time_text)
-                if match:
-                    value = int(match.group(1))
-                    
-                    if unit == 'minutes':
-                        return now - timedelta(minutes=value)
-                    elif unit == 'hours':
-                        return now - timedelta(hours=value)
-                    elif unit == 'days':
-                        return now - timedelta(days=value)
-                    elif unit == 'weeks':
-                        return now - timedelta(weeks=value)
-                    elif unit == 'months':
-                        return now - timedelta(days=value * 30)  # Aproximação
-                    elif unit == 'years':
-                        return now - timedelta(days=value * 365)  # Aproximação
-            
-            return None
-            
-        except Exception as e:
-            print(f"Erro ao parsear tempo: {time_text} - {e}")
+        if not href:
+            return href
+        prefix = href[:2]
+        if prefix == './':
+            return _BASE + href[1:]
+        if prefix[:1] == '/':
+            return _BASE + href
+        return href
+    
+    def _candidate_limit(self, max_results: int) -> Optional[int]:
+        """
+        Número máximo de candidatos a examinar (busca mais para filtrar depois);
+        None = sem limite
+        """
+        if self.candidate_factor is None:
             return None
+        return max_results * self.candidate_factor
+    
+    def _parse_time_ago(self, time_text: str, now: datetime) -> Optional[datetime]:
+        """
+        Converte texto de tempo relativo para datetime (ver parse_time_ago)
+        """
+        return parse_time_ago(time_text, now)
     
-    def _is_within_days(self, article_time: datetime, days: int) -> bool:
+    def _is_within_days(self, article_time: datetime, cutoff_date: datetime) -> bool:
         """
         Verifica se o artigo está dentro do período de dias especificado
         
         Args:
             article_time: Datetime do artigo
-            days: Número de dias para filtrar
+            cutoff_date: Data mais antiga aceita (agora - dias do filtro)
             
         Returns:
             True se estiver dentro do período, False caso contrário
@@ -90,13 +234,15 @@ class GoogleNewsScraper:
         if not article_time:
             return False
             
-        cutoff_date = datetime.now() - timedelta(days=days)
         return article_time >= cutoff_date
     
-    def search_news(self, person_name: str, days: int = 30, max_results: int = 50) -> List[Dict]:
+    async def search_news(self, person_name: str, days: int = 30, max_results: int = 50) -> List[Dict]:
         """
         Busca notícias de uma pessoa específica no Google News
         
+        O resultado fica em cache por `cache_ttl` segundos; a lista retornada é
+        compartilhada com o cache e não deve ser modificada.
+        
         Args:
             person_name: Nome da pessoa para buscar
             days: Número de dias anteriores para buscar (padrão: 30)
@@ -104,165 +250,264 @@ class GoogleNewsScraper:
             
         Returns:
             Lista de dicionários contendo informações das notícias
+            
+        Raises:
+            httpx.HTTPError: Se a requisição ao Google News falhar (falhas não
+                entram no cache)
         """
+        key = (person_name.strip().lower(), days, max_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
         try:
-            # Codifica o nome para URL
-            query = urllib.parse.quote(person_name)
-            
-            # Constrói a URL de busca
-            search_url = f"{self.base_url}?q={query}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
-            
-            print(f"Buscando notícias para: {person_name}")
-            print(f"URL: {search_url}")
+            async with lock:
+                # Outra busca idêntica pode ter preenchido o cache enquanto esperávamos
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+                
+                articles = await self._fetch_news(person_name, days, max_results)
+                self._cache[key] = articles
+                return articles
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+    
+    async def _fetch_news(self, person_name: str, days: int, max_results: int) -> List[Dict]:
+        """
+        Faz a requisição ao Google News e extrai as notícias (sem cache)
+        
+        Args:
+            person_name: Nome da pessoa para buscar
+            days: Número de dias anteriores para buscar
+            max_results: Número máximo de resultados
             
-            # Faz a requisição
-            response = self.session.get(search_url)
+        Returns:
+            Lista de dicionários contendo informações das notícias
+        """
+        print(f"Buscando notícias para: {person_name}")
+        
+        person_name_lc = person_name.lower()
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=days) if days else None
+        max_candidates = self._candidate_limit(max_results)
+        
+        articles: List[Dict] = []
+        candidates = 0
+        
+        # Faz a requisição em streaming: cada bloco recebido vai direto para o
+        # parser do libxml2, que avisa a cada elemento completo; os que casam com
+        # _XP_ARTICLES (<article> ou [data-n-au] fora de article) são
+        # extraídos conforme chegam e a conexão é fechada assim que há resultados
+        # suficientes, sem baixar/parsear o resto da página.
+        # O httpx monta e codifica a query string a partir dos parâmetros
+        params = {'q': person_name, **self._static_params}
+        async with self._client.stream('GET', self.base_url, params=params) as response:
+            print(f"URL: {response.url}")
             response.raise_for_status()
+            parser = HTMLPullParser(events=('end',), encoding=response.charset_encoding)
+            parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+            async for chunk in response.aiter_bytes():
+                # Montar a árvore (libxml2), filtrar os eventos e extrair os campos é
+                # CPU-bound: tudo roda numa thread para não travar o event loop. O
+                # parser só é usado por uma thread de cada vez (o próximo bloco só
+                # é alimentado quando esta termina)
+                found, new_articles = await asyncio.to_thread(
+                    self._consume_chunk, parser, chunk,
+                    None if max_candidates is None else max_candidates - candidates,
+                    max_results - len(articles),
+                    person_name_lc, now, cutoff_date,
+                )
+                candidates += found
+                articles += new_articles
+                if len(articles) >= max_results or (
+                    max_candidates is not None and candidates >= max_candidates
+                ):
+                    print(f"Encontrados {candidates} elementos potenciais")
+                    print(f"Encontradas {len(articles)} notícias relevantes")
+                    return articles
+        doc = await asyncio.to_thread(parser.close)
+        
+        if candidates:
+            print(f"Encontrados {candidates} elementos potenciais")
+            print(f"Encontradas {len(articles)} notícias relevantes")
+            return articles
+        
+        # Página sem contêineres de notícia: busca nos outros formatos sobre o documento completo
+        return await asyncio.to_thread(self._parse_articles, doc, person_name, days, max_results)
+    
+    def _consume_chunk(
+        self,
+        parser,
+        chunk: bytes,
+        candidates_left: Optional[int],
+        results_left: int,
+        person_name_lc: str,
+        now: datetime,
+        cutoff_date: Optional[datetime],
+    ):
+        """
+        Alimenta o parser incremental com um bloco e extrai os artigos completos
+        
+        Returns:
+            (número de candidatos consumidos, lista de artigos válidos)
+        """
+        parser.feed(chunk)
+        ready = [el for _, el in parser.read_events() if _is_article(el)]
+        if candidates_left is not None:
+            ready = ready[:candidates_left]
+        if not ready:
+            return 0, []
+        valid = self._iter_valid(ready, person_name_lc, now, cutoff_date)
+        return len(ready), list(islice(valid, results_left))
+    
+    def _parse_articles(self, doc, person_name: str, days: int, max_results: int) -> List[Dict]:
+        """
+        Extrai as notícias relevantes de uma página de busca
+        
+        Args:
+            doc: Raiz do documento lxml da página do Google News
+            person_name: Nome da pessoa para verificar relevância
+            days: Número de dias anteriores para filtrar
+            max_results: Número máximo de resultados
             
-            # Parse do HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Busca por artigos - o Google News usa estruturas complexas
-            articles = []
-            
-            # Tenta diferentes seletores que o Google News pode usar
-            selectors = [
-                'article',
-                '[data-n-au]',
-                '.JtKRv',
-                '.xrnccd',
-                '.WwrzSb',
-                '.DY5T1d'
+        Returns:
+            Lista de dicionários contendo informações das notícias
+        """
+        # Contêineres de notícia do Google News, em uma única busca
+        found_articles = _XP_ARTICLES(doc)
+        
+        if not found_articles:
+            # Outros seletores que o Google News já usou
+            found_articles = _outermost(_XP_ARTICLES_FALLBACK(doc))
+        
+        if not found_articles:
+            # Fallback: busca por links que contenham texto
+            name_pattern = re.compile(re.escape(person_name), re.IGNORECASE)
+            found_articles = [
+                el for el in doc.iter('a', 'div', 'article')
+                if len(el) == 0 and el.text and name_pattern.search(el.text)
             ]
+        
+        print(f"Encontrados {len(found_articles)} elementos potenciais")
+        
+        # Um único "agora" (e data de corte) para todos os artigos da página
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=days) if days else None
+        
+        # O gerador é preguiçoso: a extração para assim que max_results for atingido
+        valid = self._iter_valid(
+            found_articles[:self._candidate_limit(max_results)],
+            person_name.lower(), now, cutoff_date,
+        )
+        articles = list(islice(valid, max_results))
+        
+        print(f"Encontradas {len(articles)} notícias relevantes")
+        return articles
+    
+    def _iter_valid(self, elements, person_name_lc: str, now: datetime, cutoff_date: Optional[datetime]):
+        """
+        Gera os dados dos artigos relevantes e dentro do período, em ordem
+        
+        Args:
+            elements: Elementos candidatos
+            person_name_lc: Nome da pessoa (em minúsculas) para verificar relevância
+            now: Instante de referência para os tempos relativos
+            cutoff_date: Data mais antiga aceita (None = sem filtro por data)
+        """
+        for article_element in elements:
+            article_data = self._extract_article_data(article_element, person_name_lc, now)
+            if article_data is None:
+                continue
+            
+            # Verifica se está dentro do período de dias
+            article_time = article_data.get('datetime')
+            if not cutoff_date or not article_time or self._is_within_days(article_time, cutoff_date):
+                yield article_data
+    
+    @staticmethod
+    def _first_text(element, selector) -> Optional[str]:
+        """
+        Retorna o texto do primeiro nó encontrado pelo seletor
+        
+        Args:
+            element: Elemento lxml onde buscar
+            selector: XPath compilado
             
-            found_articles = []
-            for selector in selectors:
-                found = soup.select(selector)
-                if found:
-                    found_articles = found
-                    break
-            
-            if not found_articles:
-                # Fallback: busca por links que contenham texto
-                found_articles = soup.find_all(['a', 'div', 'article'], 
-                                             string=re.compile(person_name, re.IGNORECASE))
-            
-            print(f"Encontrados {len(found_articles)} elementos potenciais")
-            
-            for article_element in found_articles[:max_results * 2]:  # Busca mais para filtrar depois
-                try:
-                    article_data = self._extract_article_data(article_element, person_name)
-                    
-                    if article_data and article_data.get('title'):
-                        # Verifica se está dentro do período de dias
-                        article_time = article_data.get('datetime')
-                        if not days or not article_time or self._is_within_days(article_time, days):
-                            articles.append(article_data)
-                            
-                            if len(articles) >= max_results:
-                                break
-                                
-                except Exception as e:
-                    print(f"Erro ao processar artigo: {e}")
-                    continue
-            
-            print(f"Encontradas {len(articles)} notícias relevantes")
-            return articles[:max_results]
-            
-        except requests.RequestException as e:
-            print(f"Erro na requisição: {e}")
-            return []
-        except Exception as e:
-            print(f"Erro inesperado: {e}")
-            return []
+        Returns:
+            Texto do nó (sem espaços nas pontas) ou None se o seletor não casar
+        """
+        found = selector(element)
+        return found[0].text_content().strip() if found else None
     
-    def _extract_article_data(self, element, person_name: str) -> Optional[Dict]:
+    def _extract_article_data(self, element, person_name_lc: str, now: datetime) -> Optional[Dict]:
         """
         Extrai dados de um elemento de artigo
         
         Args:
-            element: Elemento HTML do BeautifulSoup
-            person_name: Nome da pessoa para verificar relevância
+            element: Elemento HTML do lxml
+            person_name_lc: Nome da pessoa (em minúsculas) para verificar relevância
+            now: Instante de referência para os tempos relativos
             
         Returns:
             Dicionário com dados do artigo ou None
         """
-        try:
-            article_data = {}
-            
-            # Busca título
-            title_selectors = ['h3', 'h4', '.JtKRv', '.ipQwMb', '.mCBkyc']
-            title = None
-            
-            for selector in title_selectors:
-                title_element = element.select_one(selector)
-                if title_element:
-                    title = title_element.get_text(strip=True)
-                    break
-            
-            if not title:
-                # Tenta pegar o texto do próprio elemento se for um link
-                if element.name == 'a':
-                    title = element.get_text(strip=True)
-            
-            if not title or len(title) < 10:
-                return None
-            
-            # Verifica se o título contém o nome da pessoa
-            if person_name.lower() not in title.lower():
-                return None
-            
-            article_data['title'] = title
-            
-            # Busca URL
-            link_element = element if element.name == 'a' else element.find('a')
-            if link_element and link_element.get('href'):
-                href = link_element.get('href')
-                if href.startswith('./'):
-                    href = 'https://news.google.com' + href[1:]
-                elif href.startswith('/'):
-                    href = 'https://news.google.com' + href
-                article_data['url'] = href
-            
-            # Busca fonte
-            source_selectors = ['.wEwyrc', '.vr1PYe', '.CEMjEf']
-            for selector in source_selectors:
-                source_element = element.select_one(selector)
-                if source_element:
-                    article_data['source'] = source_element.get_text(strip=True)
-                    break
-            
-            # Busca tempo
-            time_selectors = ['.r0bn4c', '.WW6dff', 'time']
-            for selector in time_selectors:
-                time_element = element.select_one(selector)
-                if time_element:
-                    time_text = time_element.get_text(strip=True)
-                    article_data['time_text'] = time_text
-                    article_data['datetime'] = self._parse_time_ago(time_text)
-                    break
-            
-            # Busca descrição/snippet
-            desc_selectors = ['.st', '.Y3v8qd']
-            for selector in desc_selectors:
-                desc_element = element.select_one(selector)
-                if desc_element:
-                    article_data['description'] = desc_element.get_text(strip=True)
-                    break
-            
-            return article_data
-            
-        except Exception as e:
-            print(f"Erro ao extrair dados do artigo: {e}")
+        # O título é parte do texto do elemento: se o nome não aparece
+        # no elemento inteiro, nem vale buscar os campos
+        if self.require_name_in_title and person_name_lc not in element.text_content().lower():
+            return None
+        
+        article_data = {}
+        
+        # Busca título
+        title = self._first_text(element, _XP_TITLE)
+        
+        if not title:
+            # Tenta pegar o texto do próprio elemento se for um link
+            if element.tag == 'a':
+                title = element.text_content().strip()
+        
+        if not title or len(title) < self.min_title_len:
+            return None
+        
+        # Verifica se o título contém o nome da pessoa
+        if self.require_name_in_title and person_name_lc not in title.lower():
             return None
+        
+        article_data['title'] = title
+        
+        # Busca URL
+        hrefs = [element.get('href')] if element.tag == 'a' else _XP_LINK(element)
+        if hrefs and hrefs[0]:
+            article_data['url'] = self._normalize_gnews_href(hrefs[0])
+        
+        # Busca fonte
+        source = self._first_text(element, _XP_SOURCE)
+        if source is not None:
+            article_data['source'] = source
+        
+        # Busca tempo
+        time_text = self._first_text(element, _XP_TIME)
+        if time_text is not None:
+            article_data['time_text'] = time_text
+            article_data['datetime'] = self._parse_time_ago(time_text, now)
+        
+        # Busca descrição/snippet
+        description = self._first_text(element, _XP_DESC)
+        if description is not None:
+            article_data['description'] = description
+        
+        return article_data
 
 
-def main():
+async def main():
     """Função principal para demonstrar o uso do scraper"""
     
-    # Inicializa o scraper
-    scraper = GoogleNewsScraper()
-    
     # Parâmetros de busca
     person_name = "Renato Cariani"  # Altere aqui o nome da pessoa
     days_back = 30  # Últimos 30 dias
@@ -271,8 +516,16 @@ def main():
     print(f"Iniciando busca por notícias de '{person_name}' dos últimos {days_back} dias...")
     print("-" * 80)
     
-    # Busca as notícias
-    articles = scraper.search_news(person_name, days_back, max_results)
+    # Inicializa o scraper e busca as notícias
+    async with GoogleNewsScraper() as scraper:
+        try:
+            articles = await scraper.search_news(person_name, days_back, max_results)
+        except httpx.HTTPError as e:
+            print(f"Erro na requisição: {e}")
+            articles = []
+        except Exception as e:
+            print(f"Erro inesperado: {e}")
+            articles = []
     
     if articles:
         print(f"\nEncontradas {len(articles)} notícias:\n")
@@ -290,8 +543,9 @@ def main():
             
         # Salva em JSON
         output_file = f"noticias_{person_name.replace(' ', '_')}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2, default=str)
+        # orjson grava UTF-8 direto e serializa datetime em ISO 8601 sem `default=`
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         print(f"\n✅ Resultados salvos em: {output_file}")
         
@@ -302,4 +556,4 @@ def main():
 if __name__ == "__main__":
     # Adiciona delay para evitar rate limiting
     time.sleep(1)
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
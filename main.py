@@ -1,25 +1,42 @@
 from fastapi import FastAPI, HTTPException, Query, Body
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from anyio import to_thread
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Literal
 import uvicorn
 
 # --- scraping / requests
+import asyncio
+import httpx
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-from urllib.parse import urlparse, parse_qs, urljoin, quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs, urljoin
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import binascii
+from functools import lru_cache
+from cachetools import TTLCache
 import time
+import atexit
+import socket
+import subprocess
+import tempfile
+import shutil
+import threading
 
 # --- selenium (igual ao teste.py, com Service correto)
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
+# --- scraper da busca (compartilhado com o script standalone)
+from google_news_scraper import GoogleNewsScraper
+
 import os, time
 # from webdriver_manager.core.utils import ChromeType
 
@@ -62,7 +79,7 @@ class ResolveBatchRequest(BaseModel):
     urls: List[str]
     use_selenium: bool = True
     timeout: int = 15
-    max_workers: int = 6
+    max_workers: int = 32
 
 
 class ResolveBatchResponse(BaseModel):
@@ -70,24 +87,358 @@ class ResolveBatchResponse(BaseModel):
     results: List[ResolveOneResponse]
 
 
+# =========================
+# POOL DE DRIVERS SELENIUM
+# =========================
+# subir Chrome + chromedriver custa centenas de ms a segundos; os drivers são
+# criados sob demanda (até SELENIUM_POOL_SIZE) e reaproveitados entre chamadas
+SELENIUM_POOL_SIZE = int(os.getenv("SELENIUM_POOL_SIZE", "6"))
+
+# a Condition protege o estado do pool e acorda quem espera quando um driver
+# é devolvido ou quando uma vaga abre (driver descartado / falha ao criar)
+_DRIVER_POOL_COND = threading.Condition()
+_IDLE_DRIVERS: List[webdriver.Chrome] = []
+_DRIVERS: List[webdriver.Chrome] = []
+_drivers_reserved = 0  # drivers vivos + em construção
+
+
+# flags do Chrome (valem tanto para o Chrome de cada driver quanto para o compartilhado)
+_CHROME_ARGS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-zygote",
+    "--disable-software-rasterizer",
+    "--hide-scrollbars",
+    "--window-size=1920,1080",
+    "--user-agent=Mozilla/5.0",
+    # 👉 só precisamos do current_url: não baixa imagem/CSS/fonte/mídia
+    "--blink-settings=imagesEnabled=false",
+)
+
+# opcional: um único Chrome com --remote-debugging-port e todos os drivers
+# conectados nele (cada um na sua aba) — um navegador em vez de N
+CHROME_REMOTE_DEBUGGING_PORT = os.getenv("CHROME_REMOTE_DEBUGGING_PORT")
+
+_shared_chrome: Optional[subprocess.Popen] = None
+_shared_chrome_profile: Optional[str] = None
+_SHARED_CHROME_LOCK = threading.Lock()
+
+# no Chrome compartilhado os prefs do perfil não se aplicam (ele já está aberto):
+# o bloqueio de CSS/fonte/mídia é feito por aba via CDP
+_BLOCKED_URL_PATTERNS = [
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+]
+
+
+def _ensure_shared_chrome() -> str:
+    """Sobe (uma vez) o Chrome compartilhado e devolve o debuggerAddress"""
+    global _shared_chrome, _shared_chrome_profile
+    port = int(CHROME_REMOTE_DEBUGGING_PORT)
+    with _SHARED_CHROME_LOCK:
+        if _shared_chrome is None or _shared_chrome.poll() is not None:
+            # Chrome anterior morreu: o perfil dele não serve mais
+            if _shared_chrome_profile:
+                shutil.rmtree(_shared_chrome_profile, ignore_errors=True)
+            _shared_chrome_profile = tempfile.mkdtemp(prefix='gnews-chrome-')
+            _shared_chrome = subprocess.Popen(
+                [
+                    os.getenv("CHROME_BIN", "/usr/bin/chromium"),
+                    *_CHROME_ARGS,
+                    f"--remote-debugging-port={port}",
+                    f"--user-data-dir={_shared_chrome_profile}",
+                    "about:blank",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            # espera a porta de debug aceitar conexões
+            deadline = time.monotonic() + 15
+            while True:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+                    break
+                except OSError:
+                    if _shared_chrome.poll() is not None or time.monotonic() > deadline:
+                        raise RuntimeError(f"Chrome compartilhado não abriu a porta {port}")
+                    time.sleep(0.1)
+    return f"127.0.0.1:{port}"
+
+
+def _build_chrome_driver() -> webdriver.Chrome:
+    options = Options()
+
+    # 👉 binários dentro do container
+    options.binary_location = os.getenv("CHROME_BIN", "/usr/bin/chromium")
+    service = Service(os.getenv("CHROMEDRIVER_PATH", "/usr/bin/chromedriver"))
+
+    # 👉 não espere render completo
+    options.page_load_strategy = "eager"   # ("none" também funciona)
+
+    if CHROME_REMOTE_DEBUGGING_PORT:
+        # conecta no Chrome já aberto e trabalha numa aba própria
+        options.add_experimental_option("debuggerAddress", _ensure_shared_chrome())
+        driver = webdriver.Chrome(service=service, options=options)
+        try:
+            driver.switch_to.new_window("tab")
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+
+    for arg in _CHROME_ARGS:
+        options.add_argument(arg)
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+        "profile.managed_default_content_settings.media_stream": 2,
+    })
+
+    return webdriver.Chrome(service=service, options=options)
+
+
+def _acquire_driver(timeout: float) -> webdriver.Chrome:
+    """
+    Pega um driver livre do pool; cria um novo se o pool ainda não está cheio,
+    senão espera (até `timeout` segundos) algum ser devolvido ou uma vaga abrir
+    """
+    global _drivers_reserved
+    deadline = time.monotonic() + timeout
+    with _DRIVER_POOL_COND:
+        while True:
+            if _IDLE_DRIVERS:
+                return _IDLE_DRIVERS.pop()
+            if _drivers_reserved < SELENIUM_POOL_SIZE:
+                _drivers_reserved += 1  # reserva a vaga; o Chrome sobe fora do lock
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"nenhum driver livre em {timeout}s")
+            _DRIVER_POOL_COND.wait(remaining)
+
+    try:
+        driver = _build_chrome_driver()
+    except Exception:
+        with _DRIVER_POOL_COND:
+            _drivers_reserved -= 1
+            _DRIVER_POOL_COND.notify()
+        raise
+
+    with _DRIVER_POOL_COND:
+        _DRIVERS.append(driver)
+    return driver
+
+
+def _discard_driver(driver: webdriver.Chrome) -> None:
+    global _drivers_reserved
+    with _DRIVER_POOL_COND:
+        if driver in _DRIVERS:
+            _DRIVERS.remove(driver)
+            _drivers_reserved -= 1
+            _DRIVER_POOL_COND.notify()
+    if CHROME_REMOTE_DEBUGGING_PORT:
+        try:
+            driver.close()  # fecha só a aba; o Chrome compartilhado continua
+        except Exception:
+            pass
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _release_driver(driver: webdriver.Chrome) -> None:
+    """Limpa o estado do driver e devolve ao pool; se ele quebrou, descarta"""
+    try:
+        # com o Chrome compartilhado os cookies valem para todas as abas: não limpa
+        if not CHROME_REMOTE_DEBUGGING_PORT:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception:
+        _discard_driver(driver)
+        return
+    with _DRIVER_POOL_COND:
+        _IDLE_DRIVERS.append(driver)
+        _DRIVER_POOL_COND.notify()
+
+
+@atexit.register
+def _quit_all_drivers() -> None:
+    with _DRIVER_POOL_COND:
+        drivers = list(_DRIVERS)
+        _DRIVERS.clear()
+        _IDLE_DRIVERS.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    if _shared_chrome is not None and _shared_chrome.poll() is None:
+        _shared_chrome.terminate()
+        try:
+            _shared_chrome.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            _shared_chrome.kill()
+    if _shared_chrome_profile:
+        shutil.rmtree(_shared_chrome_profile, ignore_errors=True)
+
+
+# =========================
+# DECODER DE /read/ (sem rede)
+# =========================
+# os links "news.google.com/read/CBMi..." (e "/articles/CBMi...") trazem a URL
+# de destino dentro de um protobuf em base64 urlsafe: campo 4, tipo
+# length-delimited (tag 0x22), seguido do tamanho em varint e da URL
+_GNEWS_ID_MARKERS = ("read", "articles")
+_PB_URL_TAG = 0x22
+# fallback quando o prefixo de tamanho não bate: a URL termina no primeiro byte
+# fora do ASCII imprimível (ou em aspas / < >)
+_URL_RE = re.compile(rb'https?://[!#-;=?-~]+')
+_URLSAFE_TO_STD = str.maketrans("-_", "+/")
+
+
+def _read_pb_url(payload: bytes) -> Optional[bytes]:
+    """Lê a URL do campo length-delimited (tag 0x22) usando o tamanho em varint"""
+    i = payload.find(_PB_URL_TAG)
+    while i != -1:
+        length, shift, j = 0, 0, i + 1
+        while j < len(payload) and shift < 35:
+            byte = payload[j]
+            length |= (byte & 0x7F) << shift
+            j += 1
+            if byte < 0x80:
+                break
+            shift += 7
+        value = payload[j:j + length]
+        if len(value) == length and value.startswith((b"http://", b"https://")):
+            return value
+        i = payload.find(_PB_URL_TAG, i + 1)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _decode_gnews_read_url(url: str) -> Optional[str]:
+    """
+    Extrai a URL original embutida no ID do artigo.
+    Retorna None se o link não é desse formato ou se o payload não traz a URL
+    em claro (IDs novos "AU_yqL..." são opacos e precisam do fallback)
+    """
+    parsed = urlparse(url)
+    if "news.google.com" not in parsed.netloc:
+        return None
+
+    segments = [seg for seg in parsed.path.split("/") if seg]
+    if len(segments) < 2 or segments[-2] not in _GNEWS_ID_MARKERS:
+        return None
+
+    article_id = segments[-1]
+    padded = article_id + "=" * (-len(article_id) % 4)
+    try:
+        payload = binascii.a2b_base64(padded.translate(_URLSAFE_TO_STD))
+    except binascii.Error:
+        return None
+
+    raw = _read_pb_url(payload)
+    if raw is None:
+        m = _URL_RE.search(payload)
+        if not m:
+            return None
+        raw = m.group(0)
+
+    try:
+        decoded = raw.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+    if not urlparse(decoded).netloc:
+        return None
+    return decoded
+
+
 # =========================
 # RESOLVER (EXATAMENTE teste.py)
 # =========================
+# sessão compartilhada entre as threads do resolver: reaproveita conexões
+# keep-alive com os hosts dos veículos (os pools do urllib3 são thread-safe)
+_RESOLVE_SESSION = requests.Session()
+_RESOLVE_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Referer": "https://news.google.com/",
+})
+_resolve_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=1, backoff_factor=0.1),
+)
+_RESOLVE_SESSION.mount("http://", _resolve_adapter)
+_RESOLVE_SESSION.mount("https://", _resolve_adapter)
+
+# hosts que recusam HEAD: cai para GET sem ler o corpo
+_HEAD_REJECTED = (403, 405)
+
+# resoluções recentes, por (url, use_selenium); falhas não entram
+_RESOLVE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_RESOLVE_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key) -> Optional[ResolveOneResponse]:
+    with _RESOLVE_CACHE_LOCK:
+        return _RESOLVE_CACHE.get(key)
+
+
+def _cache_put(key, result: ResolveOneResponse) -> None:
+    # erro (ou "unchanged" porque o requests falhou) pode ser transitório
+    if result.method == "error" or result.error:
+        return
+    # "unchanged" com use_selenium: o Selenium tentou e o redirect JS não saiu
+    # do news.google.com a tempo — também transitório
+    _, use_selenium = key
+    if use_selenium and result.method == "unchanged":
+        return
+    with _RESOLVE_CACHE_LOCK:
+        _RESOLVE_CACHE[key] = result
+
+
 def resolve_final_url_like_testepy(google_news_url: str, use_selenium: bool = True, timeout: int = 15) -> ResolveOneResponse:
     """
+    Igual a _resolve_uncached, mas consulta/alimenta o cache de resoluções
+    """
+    key = (google_news_url, use_selenium)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    result = _resolve_uncached(google_news_url, use_selenium, timeout)
+    _cache_put(key, result)
+    return result
+
+
+def _resolve_uncached(google_news_url: str, use_selenium: bool = True, timeout: int = 15) -> ResolveOneResponse:
+    """
+    0) decodifica o ID do /read/ localmente, quando a URL vem embutida
     1) requests.get(..., allow_redirects=True)
     2) se continuar em news.google.com e use_selenium=True, Selenium headless
     """
     if not google_news_url:
         return ResolveOneResponse(original="", final=None, method="error", error="empty url")
 
-    # requests
+    # decoder local: sem HTTP nem Chrome
+    decoded = _decode_gnews_read_url(google_news_url)
+    if decoded:
+        return ResolveOneResponse(original=google_news_url, final=decoded, method="requests")
+
+    # requests (HEAD: segue os redirects sem baixar o HTML do veículo)
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Referer": "https://news.google.com/",
-        }
-        r = requests.get(google_news_url, headers=headers, allow_redirects=True, timeout=timeout)
+        r = _RESOLVE_SESSION.head(google_news_url, allow_redirects=True, timeout=timeout)
+        if r.status_code in _HEAD_REJECTED:
+            r = _RESOLVE_SESSION.get(google_news_url, allow_redirects=True, timeout=timeout, stream=True)
+            r.close()
         if r.url and "news.google.com" not in r.url:
             return ResolveOneResponse(original=google_news_url, final=r.url, method="requests")
     except Exception as e:
@@ -95,61 +446,11 @@ def resolve_final_url_like_testepy(google_news_url: str, use_selenium: bool = Tr
     else:
         req_err = None
 
-    # selenium (fallback)
     # selenium (fallback)
     if use_selenium:
-        driver = None
-        try:
-            options = Options()
-            options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-zygote")
-            options.add_argument("--disable-software-rasterizer")
-            options.add_argument("--hide-scrollbars")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("--user-agent=Mozilla/5.0")
-
-            # 👉 binários dentro do container
-            options.binary_location = os.getenv("CHROME_BIN", "/usr/bin/chromium")
-            service = Service(os.getenv("CHROMEDRIVER_PATH", "/usr/bin/chromedriver"))
-
-            # 👉 não espere render completo
-            options.page_load_strategy = "eager"   # ("none" também funciona)
-
-            driver = webdriver.Chrome(service=service, options=options)
-
-            # tempo para a navegação; se estourar, ainda tentamos pegar current_url
-            driver.set_page_load_timeout(timeout)
-
-            try:
-                driver.get(google_news_url)
-            except TimeoutException:
-                # ignore — normalmente já redirecionou
-                pass
-
-            # dá um respiro pro redirect JS concluir
-            time.sleep(2.0)
-
-            final_url = driver.current_url
-            if final_url and "news.google.com" not in final_url:
-                return ResolveOneResponse(original=google_news_url, final=final_url, method="selenium")
-
-        except Exception as e:
-            return ResolveOneResponse(
-                original=google_news_url,
-                final=None,
-                method="error",
-                error=f"selenium: {e}"
-            )
-        finally:
-            try:
-                if driver:
-                    driver.quit()
-            except Exception:
-                pass
-
+        result = _resolve_with_selenium(google_news_url, timeout)
+        if result:
+            return result
 
     # sem mudança
     return ResolveOneResponse(
@@ -160,132 +461,100 @@ def resolve_final_url_like_testepy(google_news_url: str, use_selenium: bool = Tr
     )
 
 
-# =========================
-# SCRAPER (BUSCA)
-# =========================
-class GoogleNewsScraper:
-    def __init__(self):
-        self.base_url = "https://news.google.com/search"
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
-            "Connection": "keep-alive",
-            "Referer": "https://news.google.com/",
-        })
-
-    @staticmethod
-    def _normalize_gnews_href(href: str) -> str:
-        if not href:
-            return href
-        if href.startswith("./"):
-            return "https://news.google.com" + href[1:]
-        if href.startswith("/"):
-            return "https://news.google.com" + href
-        return href
-
-    @staticmethod
-    def _parse_time_ago(time_text: str) -> Optional[datetime]:
+def _resolve_with_selenium(google_news_url: str, timeout: int) -> Optional[ResolveOneResponse]:
+    """
+    Abre a URL num driver do pool e lê a URL final após o redirect JS.
+    Retorna None se o navegador continuar em news.google.com
+    """
+    driver = None
+    try:
+        driver = _acquire_driver(timeout)
+
+        # tempo para a navegação; se estourar, ainda tentamos pegar current_url
+        driver.set_page_load_timeout(min(timeout, 8))
+
         try:
-            t = (time_text or "").lower().strip()
-            now = datetime.now()
-            rules = [
-                (r"(\d+)\s*minuto[s]?\s*atrás", "minutes", 1),
-                (r"(\d+)\s*hora[s]?\s*atrás", "hours", 1),
-                (r"(\d+)\s*dia[s]?\s*atrás", "days", 1),
-                (r"(\d+)\s*semana[s]?\s*atrás", "days", 7),
-                (r"(\d+)\s*m[eê]s(?:es)?\s*atrás", "days", 30),
-                (r"(\d+)\s*ano[s]?\s*atrás", "days", 365),
-            ]
-            for pattern, unit, factor in rules:
-                m = re.search(pattern, t)
-                if m:
-                    val = int(m.group(1)) * factor
-                    return now - timedelta(**{unit: val})
-            return None
-        except Exception:
-            return None
+            driver.get(google_news_url)
+        except TimeoutException:
+            # ignore — normalmente já redirecionou
+            pass
 
-    @staticmethod
-    def _is_within_days(dt: Optional[datetime], days: int) -> bool:
-        if not dt:
-            return False
-        return dt >= (datetime.now() - timedelta(days=days))
-
-    def search_news(self, person_name: str, days: int, max_results: int) -> List[Dict]:
-        q = quote(person_name)
-        url = f"{self.base_url}?q={q}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
-        r = self.session.get(url, timeout=30)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        candidates = soup.select("article") or soup.select(".xrnccd") or []
-        if not candidates:
-            candidates = soup.find_all(["article", "div"])
-
-        results: List[Dict] = []
-        for el in candidates:
-            if len(results) >= max_results:
-                break
+        # espera o redirect JS sair do news.google.com (em vez de um sleep fixo)
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.current_url and "news.google.com" not in d.current_url
+            )
+        except TimeoutException:
+            pass
 
-            # título
-            title = None
-            for sel in ["h3", "h4", "a.DY5T1d", ".JtKRv", ".ipQwMb", ".mCBkyc"]:
-                node = el.select_one(sel)
-                if node:
-                    title = node.get_text(strip=True)
-                    break
-            if not title and el.name == "a":
-                title = el.get_text(strip=True)
-            if not title or len(title) < 6:
-                continue
-
-            # link (ORIGINAL do Google)
-            link_el = el if el.name == "a" else el.find("a", href=True)
-            url = ""
-            if link_el:
-                url = self._normalize_gnews_href(link_el.get("href", ""))
-
-            # fonte
-            source = ""
-            for sel in [".wEwyrc", ".vr1PYe", ".CEMjEf"]:
-                node = el.select_one(sel)
-                if node:
-                    source = node.get_text(strip=True)
-                    break
+        final_url = driver.current_url
+        if final_url and "news.google.com" not in final_url:
+            return ResolveOneResponse(original=google_news_url, final=final_url, method="selenium")
+        return None
 
-            # tempo
-            time_text, dt = "", None
-            for sel in [".r0bn4c", ".WW6dff", "time"]:
-                node = el.select_one(sel)
-                if node:
-                    time_text = node.get_text(strip=True)
-                    dt = self._parse_time_ago(time_text)
-                    break
+    except Exception as e:
+        # driver em estado desconhecido: não volta pro pool
+        if driver:
+            _discard_driver(driver)
+            driver = None
+        return ResolveOneResponse(
+            original=google_news_url,
+            final=None,
+            method="error",
+            error=f"selenium: {e}"
+        )
+    finally:
+        if driver:
+            _release_driver(driver)
 
-            # descrição
-            desc = ""
-            for sel in [".Y3v8qd", ".st"]:
-                node = el.select_one(sel)
-                if node:
-                    desc = node.get_text(strip=True)
-                    break
 
-            # filtro por tempo
-            if days and dt and not self._is_within_days(dt, days):
-                continue
+async def resolve_http_async(
+    client: httpx.AsyncClient,
+    google_news_url: str,
+    timeout: int = 15,
+) -> ResolveOneResponse:
+    """
+    Passo HTTP do lote (decoder local + HEAD/GET no AsyncClient compartilhado),
+    sem Selenium: o que continuar em news.google.com volta como "unchanged" e o
+    lote decide se passa pelo navegador
+    """
+    if not google_news_url:
+        return ResolveOneResponse(original="", final=None, method="error", error="empty url")
+
+    key = (google_news_url, False)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    decoded = _decode_gnews_read_url(google_news_url)
+    if decoded:
+        result = ResolveOneResponse(original=google_news_url, final=decoded, method="requests")
+        _cache_put(key, result)
+        return result
 
-            results.append({
-                "title": title,
-                "source": source,
-                "url": url,  # <-- mantém o ORIGINAL do Google
-                "time_text": time_text,
-                "datetime": dt,
-                "description": desc,
-            })
+    req_err = None
+    try:
+        r = await client.head(google_news_url, timeout=timeout)
+        if r.status_code in _HEAD_REJECTED:
+            # GET em stream: só os headers; o corpo é descartado ao sair
+            async with client.stream("GET", google_news_url, timeout=timeout) as r:
+                pass
+        final = str(r.url)
+        if final and "news.google.com" not in final:
+            result = ResolveOneResponse(original=google_news_url, final=final, method="requests")
+            _cache_put(key, result)
+            return result
+    except Exception as e:
+        req_err = str(e)
 
-        return results[:max_results]
+    result = ResolveOneResponse(
+        original=google_news_url,
+        final=google_news_url,
+        method="unchanged",
+        error=req_err
+    )
+    _cache_put(key, result)
+    return result
 
 
 # =========================
@@ -297,6 +566,7 @@ app = FastAPI(
     version="3.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -305,7 +575,35 @@ app.add_middleware(
     allow_methods=["*"], allow_headers=["*"],
 )
 
-scraper = GoogleNewsScraper()
+# o /search sempre devolveu o que o Google encontra para a busca (sem exigir o
+# nome no título), com títulos a partir de 6 caracteres e sem limitar candidatos
+scraper = GoogleNewsScraper(require_name_in_title=False, min_title_len=6, candidate_factor=None)
+
+# threads disponíveis para o trabalho bloqueante (requests + Selenium do /resolve)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+
+# cliente HTTP/2 do POST /resolve, criado no startup (precisa do event loop)
+resolve_client: Optional[httpx.AsyncClient] = None
+
+
+@app.on_event("startup")
+async def startup():
+    global resolve_client
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    resolve_client = httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        headers=dict(_RESOLVE_SESSION.headers),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await scraper.aclose()
+    if resolve_client is not None:
+        await resolve_client.aclose()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -326,7 +624,12 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "ts": datetime.now().isoformat(), "version": "3.0.0"}
+    return {
+        "status": "ok",
+        "ts": datetime.now().isoformat(),
+        "version": "3.0.0",
+        "search_cache": scraper.cache_info(),
+    }
 
 
 @app.get(
@@ -347,7 +650,7 @@ async def search_news(
         if not person_name.strip():
             raise HTTPException(status_code=400, detail="Nome da pessoa não pode estar vazio")
 
-        raw = scraper.search_news(
+        raw = await scraper.search_news(
             person_name=person_name.strip(),
             days=days_back,
             max_results=max_results
@@ -355,17 +658,18 @@ async def search_news(
 
         articles: List[NewsArticle] = []
         for a in raw:
+            # `raw` vem do cache do scraper: lê sem modificar os dicts
             published_at = a.get("datetime").isoformat() if a.get("datetime") else ""
-            a.pop("datetime", None)
 
-            articles.append(NewsArticle(**{
-                "title": a.get("title", ""),
-                "source": a.get("source", ""),
-                "url": a.get("url", ""),  # mantém Google
-                "time_text": a.get("time_text", ""),
-                "published_at": published_at,
-                "description": a.get("description", ""),
-            }))
+            # dados já vêm limpos do scraper: model_construct pula a validação
+            articles.append(NewsArticle.model_construct(
+                title=a.get("title", ""),
+                source=a.get("source", ""),
+                url=a.get("url", ""),  # mantém Google
+                time_text=a.get("time_text", ""),
+                published_at=published_at,
+                description=a.get("description", ""),
+            ))
 
         return SearchResponse(
             success=True,
@@ -391,8 +695,8 @@ async def resolve_one(
 ):
     if not u:
         raise HTTPException(status_code=400, detail="Parâmetro 'u' é obrigatório")
-    result = resolve_final_url_like_testepy(u, use_selenium=use_selenium, timeout=timeout)
-    return result
+    # requests/Selenium são bloqueantes: rodam no threadpool, fora do event loop
+    return await run_in_threadpool(resolve_final_url_like_testepy, u, use_selenium, timeout)
 
 
 # ---------- RESOLVE (lote) ----------
@@ -401,21 +705,50 @@ async def resolve_batch(body: ResolveBatchRequest = Body(...)):
     if not body.urls:
         raise HTTPException(status_code=400, detail="Lista 'urls' vazia")
 
-    results: List[ResolveOneResponse] = []
-    # paralelismo simples (I/O bound)
-    with ThreadPoolExecutor(max_workers=max(1, body.max_workers)) as ex:
-        future_map = {
-            ex.submit(resolve_final_url_like_testepy, u, body.use_selenium, body.timeout): u
-            for u in body.urls
-        }
-        for fut in as_completed(future_map):
+    # cada URL distinta é resolvida uma vez; repetidas reaproveitam o resultado
+    unique_urls = list(dict.fromkeys(body.urls))
+    resolved: Dict[str, ResolveOneResponse] = {}
+    pending: List[str] = []
+    for u in unique_urls:
+        cached = _cache_get((u, body.use_selenium))
+        if cached is not None:
+            resolved[u] = cached
+        else:
+            pending.append(u)
+
+    # 1) só HTTP: barato, bastante paralelismo
+    http_sem = asyncio.Semaphore(max(1, min(len(pending), body.max_workers * 2, 64)))
+
+    async def _http_step(u: str) -> ResolveOneResponse:
+        async with http_sem:
             try:
-                results.append(fut.result())
+                return await resolve_http_async(resolve_client, u, body.timeout)
             except Exception as e:
-                u = future_map[fut]
-                results.append(ResolveOneResponse(original=u, final=None, method="error", error=str(e)))
-
-    return ResolveBatchResponse(results=results)
+                return ResolveOneResponse(original=u, final=None, method="error", error=str(e))
+
+    needs_browser: List[ResolveOneResponse] = []
+    for u, r in zip(pending, await asyncio.gather(*(_http_step(u) for u in pending))):
+        if body.use_selenium and r.method == "unchanged":
+            needs_browser.append(r)
+        else:
+            resolved[u] = r
+            if body.use_selenium:
+                _cache_put((u, True), r)
+
+    # 2) Selenium só para o que sobrou: poucos em paralelo, drivers são caros
+    browser_sem = asyncio.Semaphore(max(1, min(SELENIUM_POOL_SIZE, 4, body.max_workers)))
+
+    async def _browser_step(prev: ResolveOneResponse) -> ResolveOneResponse:
+        async with browser_sem:
+            result = await asyncio.to_thread(_resolve_with_selenium, prev.original, body.timeout)
+        result = result or prev
+        _cache_put((prev.original, True), result)
+        return result
+
+    for r in await asyncio.gather(*(_browser_step(r) for r in needs_browser)):
+        resolved[r.original] = r
+
+    return ResolveBatchResponse(results=[resolved[u] for u in body.urls])
 
 
 if __name__ == "__main__":